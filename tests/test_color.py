@@ -1,22 +1,191 @@
+import array
+import typing
+
+import numpy as np
 import pytest
 
-from physiscript.utils import Color
+from physiscript.utils import Color, ColorLike
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_color"),
+    [
+        (Color(0.4, 0.5, 1), Color(0.4, 0.5, 1)),
+        ("red", Color(1, 0, 0)),
+        ("Alice Blue", Color.from_rgb(240, 248, 255)),
+        ("#3C54FF", Color.from_rgb(0x3C, 0x54, 0xFF)),
+        ("#EE98FE80", Color.from_rgba(0xEE, 0x98, 0xFE, 0x80)),
+        ("#F80", Color.from_rgb(0xFF, 0x88, 0x00)),
+        ("#f80c", Color.from_rgba(0xFF, 0x88, 0x00, 0xCC)),
+        ("rgb(60, 84, 255)", Color.from_rgb(60, 84, 255)),
+        ("RGBA(0,128,0,0.5)", Color(0, 128 / 255, 0, 0.5)),
+        ("0x404040", Color.from_rgb(0x40, 0x40, 0x40)),
+        ("0x33225599", Color.from_rgba(0x33, 0x22, 0x55, 0x99)),
+        (bytes([255, 255, 255]), Color(1, 1, 1)),
+        (bytearray([0, 128, 0, 200]), Color.from_rgba(0, 128, 0, 200)),
+        (0x4566FFFF, Color.from_rgba(0x45, 0x66, 0xFF, 0xFF)),
+        ([0, 1, 0.5], Color(0, 1, 0.5)),
+        (np.array([0, 1, 0.5, 0.25]), Color(0, 1, 0.5, 0.25)),
+    ],
+)
+def test_create(value: ColorLike, expected_color: Color) -> None:
+    Color.clear_cache()
+    assert Color.create(value) == expected_color
+    # The second time may be served from the cache
+    assert Color.create(value) == expected_color
+
+
+def test_color_like_is_a_union() -> None:
+    assert Color in typing.get_args(ColorLike)
+    assert np.ndarray in typing.get_args(ColorLike | None)
+
+
+def test_predefined_constants() -> None:
+    assert Color.get("red") == Color.RED
+    assert Color.from_rgb(240, 248, 255) == Color.ALICE_BLUE
+    assert "YELLOW_GREEN" in dir(Color)
+    # Constants are class attributes, so they're reachable from instances too
+    assert Color(0, 0, 0).DARK_KHAKI is Color.get("dark-khaki")
+    with pytest.raises(AttributeError):
+        _ = Color.NOT_A_COLOR
 
 
 @pytest.mark.parametrize(
-    ("created_color", "expected_color"),
+    ("color", "expected_name"),
     [
-        (Color.create(Color(0.4, 0.5, 1)), Color(0.4, 0.5, 1)),
-        (Color.create("red"), Color(1, 0, 0)),
-        (Color.create("#3C54FF"), Color.from_rgb(0x3C, 0x54, 0xFF)),
-        (Color.create("#EE98FE80"), Color.from_rgba(0xEE, 0x98, 0xFE, 0x80)),
-        (Color.create("0x404040"), Color.from_rgb(0x40, 0x40, 0x40)),
-        (Color.create("0x33225599"), Color.from_rgba(0x33, 0x22, 0x55, 0x99)),
-        (Color.create(bytes([255, 255, 255])), Color(1, 1, 1)),
-        (Color.create(bytearray([0, 128, 0, 200])), Color.from_rgba(0, 128, 0, 200)),
-        (Color.create(0x4566FFFF), Color.from_rgba(0x45, 0x66, 0xFF, 0xFF)),
-        (Color.create([0, 1, 0.5]), Color(0, 1, 0.5)),
+        (Color(1, 0, 0), "red"),
+        (Color.from_rgb(250, 5, 3), "red"),
+        (Color.from_rgb(1, 1, 2), "black"),
+        (Color.from_rgba(240, 248, 255, 0), "alice-blue"),
     ],
 )
-def test_create(created_color: Color, expected_color: Color) -> None:
-    assert created_color == expected_color
+def test_nearest_name(color: Color, expected_name: str) -> None:
+    assert color.nearest_name() == expected_name
+
+
+def test_int() -> None:
+    color = Color.from_rgba(0x12, 0x34, 0x56, 0x78)
+    assert int(color) == 0x12345678
+    assert int(color) == color.int()
+    assert hash(color) == hash(Color.from_int(0x12345678))
+
+
+def test_from_int_converts_integers() -> None:
+    color = Color.from_int(np.uint32(0x11223344))
+    assert color.rgba() == (0x11, 0x22, 0x33, 0x44)
+    assert color.bytes() == b"\x11\x22\x33\x44"
+    assert isinstance(color.int(), int)
+    value = True
+    assert not isinstance(Color.create(value).int(), bool)
+    assert Color.create(value) == Color.from_int(1)
+
+
+def test_names_sorted() -> None:
+    names = Color.names()
+    assert names == sorted(names)
+    assert Color.get("red1") is Color.get("red")
+
+
+@pytest.mark.parametrize("name", ["alice-blue", "aliceblue", "alice_blue", "AliceBlue"])
+def test_get_normalizes_name(name: str) -> None:
+    assert Color.get(name) is Color.ALICE_BLUE
+
+
+def test_get_unknown_name() -> None:
+    assert Color.get("not-a-color") is None
+    assert Color.get(None) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "#12345",
+        "#12 456",
+        "#+12345",
+        "#1_2345",
+        "#ggg",
+        "0x12345",
+        "0x+1234567",
+        "rgb(256, 0, 0)",
+        "rgb(0, 0)",
+        "rgba(0, 0, 0, 1.5)",
+    ],
+)
+def test_create_invalid_string(value: str) -> None:
+    with pytest.raises(ValueError, match="Invalid string format"):
+        Color.create(value)
+
+
+def test_bytes_array() -> None:
+    colors = [Color.from_rgba(0x12, 0x34, 0x56, 0x78), Color.RED, Color.TEAL]
+    data = b"".join(bytes(c) for c in colors)
+    normalized = Color.from_bytes_array(data)
+    assert normalized.shape == (3, 4)
+    np.testing.assert_allclose(normalized, [c.normalized_rgba() for c in colors])
+    assert Color.to_bytes_array(normalized).tobytes() == data
+    with pytest.raises(ValueError, match="between 0 and 255"):
+        Color.from_bytes_array([[0, 0, 0, 256]])
+
+
+def test_bytes_formats_agree() -> None:
+    color = Color.from_int(0x12345678)
+    assert Color.from_bytes(bytes([0x12, 0x34, 0x56, 0x78])) == color
+    assert Color.from_html("#12345678") == color
+    assert Color.from_hex("0x123456") == Color.from_bytes(b"\x12\x34\x56")
+    assert Color.from_rgba(0x12, 0x34, 0x56, 0x78) == color
+
+
+def test_create_uncached_values() -> None:
+    assert Color.create(memoryview(bytearray(b"\x01\x02\x03"))) == Color.from_rgb(
+        1, 2, 3
+    )
+    assert Color.create([0.5, 0.5, 0.5]) == Color(0.5, 0.5, 0.5)
+
+
+def test_from_bytes_counts_raw_bytes() -> None:
+    wide = memoryview(array.array("H", [1, 2, 3]))
+    with pytest.raises(ValueError, match="Invalid bytes format"):
+        Color.from_bytes(wide)
+    # Two 16-bit items are 4 bytes, so they're read as RGBA
+    rgba = memoryview(array.array("H", [0x1234, 0x5678]))
+    assert Color.from_bytes(rgba) == Color.from_bytes(rgba.tobytes())
+
+
+def test_create_caches_tuples_by_coordinate_types() -> None:
+    Color.clear_cache()
+    flags = Color.create((True, False, False))
+    assert (flags.red, flags.green, flags.blue) == (True, False, False)
+    assert all(isinstance(c, bool) for c in (flags.red, flags.green, flags.blue))
+    # Equal to the tuple of bools, but cached separately
+    color = Color.create((1, 0, 0))
+    assert color is not flags
+    assert Color.create((1, 0, 0)) is color
+    assert not isinstance(color.red, bool)
+
+
+def test_clear_cache() -> None:
+    color = Color.from_html("#010203")
+    assert Color.from_html("#010203") is color
+    Color.clear_cache()
+    assert Color.create("#010203") == color
+
+
+def test_bytes_array_keeps_shape() -> None:
+    image = np.arange(2 * 5 * 3, dtype=np.uint8).reshape(2, 5, 3)
+    normalized = Color.from_bytes_array(image)
+    assert normalized.shape == image.shape
+    assert normalized.dtype == np.float32
+    np.testing.assert_array_equal(Color.to_bytes_array(normalized), image)
+    with pytest.raises(ValueError, match="3 \\(RGB\\) or 4 \\(RGBA\\)"):
+        Color.from_bytes_array(np.zeros((2, 5), dtype=np.uint8))
+
+
+def test_int_array() -> None:
+    values = [0x12345678, 0xFF0000FF, 0]
+    np.testing.assert_array_equal(
+        Color.from_int_array(values),
+        Color.from_bytes_array([Color.from_int(v).rgba() for v in values]),
+    )
+    assert Color.from_int_array(np.zeros((2, 3), dtype=np.uint32)).shape == (2, 3, 4)
+    with pytest.raises(TypeError, match="must be integers"):
+        Color.from_int_array([1.7])